@@ -1,6 +1,14 @@
 import os
-import requests
+import sys
+import asyncio
+import random
+import string
+import threading
+import time
+import httpx
+import orjson
 from typing import List, Dict, Union, Optional
+from collections import ChainMap, defaultdict
 from datetime import datetime
 import logging
 from dotenv import load_dotenv
@@ -18,45 +26,213 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Alert template compiled once at import; substitute() is C-backed and
+# skips re-parsing the format string on every call
+ALERT_TMPL = string.Template("""🔥 <b>New Token Alert!</b>
+
+Name: $name
+Symbol: $symbol
+Price: $$$price
+Liquidity: $$$liquidity
+Change 24h: $change_24h%
+
+<a href="$trade_url">Trade Now</a>""")
+
+# URL-less button skeleton; only the urls are rebound per alert
+BUTTON_SKELETON = ({'text': '📊 Chart'}, {'text': '💱 Trade'})
+
+# Telegram caps message text at 4096 chars
+TELEGRAM_MAX_LEN = 4096
+FLUSH_INTERVAL = 0.5
+
+# Recipients per broadcast window - kept under the ~30 msg/sec ceiling
+BROADCAST_CHUNK = 25
+
+JSON_HEADERS = {'content-type': 'application/json'}
+
+# Interned once so hot-path default hits reuse the same string objects
+_NA = sys.intern('N/A')
+_ZERO = sys.intern('0.0')
+_ZERO_PCT = sys.intern('0')
+_HASH = sys.intern('#')
+
+ALERT_DEFAULTS = {
+    'name': _NA,
+    'symbol': _NA,
+    'price': _ZERO,
+    'liquidity': _ZERO,
+    'change_24h': _ZERO_PCT,
+    'trade_url': _HASH,
+    'chart_url': _HASH
+}
+
 class TelegramClient:
     
-    def __init__(self, bot_token: Optional[str] = None):
+    def __init__(
+        self,
+        bot_token: Optional[str] = None,
+        coalesce: bool = False,
+        mode: str = 'polling'
+    ):
 
         self.bot_token = bot_token or os.getenv('BOT_TOKEN')
         if not self.bot_token:
             raise ValueError("Bot token must be provided or set in BOT_TOKEN environment variable")
+
+        if mode not in ('polling', 'webhook'):
+            raise ValueError("mode must be 'polling' or 'webhook'")
+        self.mode = mode
         
         self.api_url = f"https://api.telegram.org/bot{self.bot_token}"
-        self.session = requests.Session()
+        # HTTP/2 client: concurrent sends multiplex over one connection
+        # instead of each needing its own pooled HTTP/1.1 connection
+        self.client = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+            timeout=10
+        )
+
+        # Separate client for getUpdates so its long-poll can't starve sends
+        self.updates_client = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_connections=2, max_keepalive_connections=2),
+            timeout=35
+        )
+
+        self.aclient: Optional[httpx.AsyncClient] = None
+        self._aclient_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._update_offset = 0
+
+        # Token bucket paced just under Telegram's ~30 msg/sec global limit
+        self._bucket = {'tokens': 30.0, 'last': time.monotonic(), 'rate': 28.0, 'cap': 30.0}
+        self._bucket_lock = asyncio.Lock()
+
+        # Optional coalescing: queue messages per chat and flush them joined,
+        # so bursts of alerts to one chat cost one sendMessage instead of many
+        self.coalesce = coalesce
+        # Queued as (text, parse_mode, disable_preview) so flush can forward
+        # the options each caller passed
+        self._pending: Dict[Union[int, str], List[tuple]] = defaultdict(list)
+        self._pending_lock = threading.Lock()
+        if coalesce:
+            flusher = threading.Thread(target=self._flush_loop, daemon=True)
+            flusher.start()
 
     def _make_request(self, method: str, **kwargs) -> Dict:
 
+        attempts = 5
+        for attempt in range(attempts):
+            last = attempt == attempts - 1
+
+            try:
+                response = self.client.post(
+                    f"{self.api_url}/{method}",
+                    **kwargs
+                )
+            except httpx.HTTPError as e:
+                logger.error(f"Error in API request to {method}: {e}")
+                if last:
+                    raise
+                time.sleep(min(30, 0.5 * 2 ** attempt) + random.uniform(0, 0.25))
+                continue
+
+            if response.status_code == 429 and not last:
+                retry_after = self._retry_after(response)
+                logger.warning(f"Rate limited on {method}, retrying in {retry_after}s")
+                time.sleep(retry_after + random.uniform(0, 0.25))
+                continue
+
+            if response.status_code >= 500 and not last:
+                logger.warning(f"Got {response.status_code} from {method}, retrying")
+                time.sleep(min(30, 0.5 * 2 ** attempt) + random.uniform(0, 0.25))
+                continue
+
+            try:
+                response.raise_for_status()
+                return response.json()
+            except httpx.HTTPError as e:
+                logger.error(f"Error in API request to {method}: {e}")
+                raise
+
+    @staticmethod
+    def _retry_after(response) -> int:
+
         try:
-            response = self.session.post(
-                f"{self.api_url}/{method}",
-                **kwargs
-            )
-            response.raise_for_status()
-            return response.json()
-        
-        except requests.RequestException as e:
-            logger.error(f"Error in API request to {method}: {e}")
-            raise
+            return int(response.json().get('parameters', {}).get(
+                'retry_after',
+                response.headers.get('Retry-After', 1)
+            ))
+        except Exception:
+            return 1
+
+    def set_webhook(self, url: str, secret_token: Optional[str] = None) -> Dict:
+
+        payload = {'url': url, 'allowed_updates': ['message']}
+        if secret_token:
+            payload['secret_token'] = secret_token
+        return self._make_request('setWebhook', json=payload)
+
+    def delete_webhook(self) -> Dict:
+
+        return self._make_request('deleteWebhook', json={})
+
+    async def serve_webhook(
+        self,
+        secret: str,
+        handler,
+        host: str = '0.0.0.0',
+        port: int = 8443
+    ) -> None:
+
+        from aiohttp import web
+
+        async def receive(request):
+            update = await request.json()
+            result = handler(update)
+            if asyncio.iscoroutine(result):
+                await result
+            return web.Response(text='ok')
+
+        app = web.Application()
+        app.router.add_post(f'/telegram/{secret}', receive)
+
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, host, port)
+        await site.start()
+        logger.info(f"Webhook server listening on {host}:{port}")
+
+        while True:
+            await asyncio.sleep(3600)
 
     def get_updates(self) -> List[Dict]:
-  
+
+        if self.mode == 'webhook':
+            raise RuntimeError("get_updates is disabled in webhook mode; updates are pushed to the webhook")
+
         try:
-            response = self.session.get(f"{self.api_url}/getUpdates")
+            response = self.updates_client.get(
+                f"{self.api_url}/getUpdates",
+                params={
+                    'timeout': 30,
+                    'offset': self._update_offset,
+                    # Array params in the query string must be JSON-encoded
+                    'allowed_updates': orjson.dumps(['message']).decode()
+                }
+            )
             response.raise_for_status()
             updates = response.json()['result']
-            
+
+            if updates:
+                self._update_offset = max(u['update_id'] for u in updates) + 1
+
             return [{
                 'chat_id': update['message']['chat']['id'],
                 'username': update['message']['chat'].get('username'),
                 'date': datetime.fromtimestamp(update['message']['date'])
             } for update in updates if 'message' in update]
             
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Error getting updates: {e}")
             raise
 
@@ -68,6 +244,11 @@ class TelegramClient:
         disable_preview: bool = False
     ) -> Dict:
 
+        if self.coalesce:
+            with self._pending_lock:
+                self._pending[chat_id].append((text, parse_mode, disable_preview))
+            return {'chat_id': chat_id, 'queued': True}
+
         return self._make_request(
             'sendMessage',
             json={
@@ -78,6 +259,55 @@ class TelegramClient:
             }
         )
 
+    def _flush_loop(self) -> None:
+
+        while True:
+            time.sleep(FLUSH_INTERVAL)
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Error flushing pending messages: {e}")
+
+    def flush(self) -> None:
+
+        with self._pending_lock:
+            pending = {cid: msgs for cid, msgs in self._pending.items() if msgs}
+            self._pending.clear()
+
+        for chat_id, msgs in pending.items():
+            # Join queued texts, splitting where they'd exceed Telegram's
+            # limit or where the caller-supplied options differ
+            chunks = []
+            batch = []
+            batch_opts = None
+            length = 0
+            for msg, parse_mode, disable_preview in msgs:
+                opts = (parse_mode, disable_preview)
+                if batch and (opts != batch_opts or length + len(msg) + 2 > TELEGRAM_MAX_LEN):
+                    chunks.append(("\n\n".join(batch),) + batch_opts)
+                    batch = []
+                    length = 0
+                batch.append(msg)
+                batch_opts = opts
+                length += len(msg) + 2
+            if batch:
+                chunks.append(("\n\n".join(batch),) + batch_opts)
+
+            for text, parse_mode, disable_preview in chunks:
+                self._take_token()
+                try:
+                    self._make_request(
+                        'sendMessage',
+                        json={
+                            'chat_id': chat_id,
+                            'text': text,
+                            'parse_mode': parse_mode,
+                            'disable_web_page_preview': disable_preview
+                        }
+                    )
+                except Exception as e:
+                    logger.error(f"Error flushing to {chat_id}: {e}")
+
     def send_message_with_buttons(
         self,
         chat_id: Union[int, str],
@@ -107,19 +337,12 @@ class TelegramClient:
         disable_preview: bool = True
     ) -> Dict:
  
-        message_text = f"""🔥 <b>New Token Alert!</b>
-
-Name: {token_data.get('name', 'N/A')}
-Symbol: {token_data.get('symbol', 'N/A')}
-Price: ${token_data.get('price', '0.0')}
-Liquidity: ${token_data.get('liquidity', '0.0')}
-Change 24h: {token_data.get('change_24h', '0')}%
-
-<a href="{token_data.get('trade_url', '#')}">Trade Now</a>"""
+        view = ChainMap(token_data, ALERT_DEFAULTS)
+        message_text = ALERT_TMPL.substitute(view)
 
         buttons = [[
-            {"text": "📊 Chart", "url": token_data.get('chart_url', '#')},
-            {"text": "💱 Trade", "url": token_data.get('trade_url', '#')}
+            {**BUTTON_SKELETON[0], 'url': view['chart_url']},
+            {**BUTTON_SKELETON[1], 'url': view['trade_url']}
         ]]
 
         return self.send_message_with_buttons(
@@ -129,31 +352,131 @@ Change 24h: {token_data.get('change_24h', '0')}%
             disable_preview=disable_preview
         )
 
-    def broadcast_message(
+    def _take_token(self) -> None:
+
+        bucket = self._bucket
+        now = time.monotonic()
+        bucket['tokens'] = min(
+            bucket['cap'],
+            bucket['tokens'] + (now - bucket['last']) * bucket['rate']
+        )
+        bucket['last'] = now
+        if bucket['tokens'] < 1:
+            time.sleep((1 - bucket['tokens']) / bucket['rate'])
+        bucket['tokens'] -= 1
+
+    async def _take_token_async(self) -> None:
+
+        async with self._bucket_lock:
+            bucket = self._bucket
+            now = time.monotonic()
+            bucket['tokens'] = min(
+                bucket['cap'],
+                bucket['tokens'] + (now - bucket['last']) * bucket['rate']
+            )
+            bucket['last'] = now
+            if bucket['tokens'] < 1:
+                await asyncio.sleep((1 - bucket['tokens']) / bucket['rate'])
+            bucket['tokens'] -= 1
+
+    def _get_aclient(self) -> httpx.AsyncClient:
+
+        # Rebuild when the running loop changes: asyncio.run in the sync
+        # wrapper closes its loop, and pooled connections bound to a closed
+        # loop fail every subsequent send with "Event loop is closed".
+        # The bucket lock binds to a loop on first contention, so it has to
+        # be recreated alongside the client
+        loop = asyncio.get_running_loop()
+        if self.aclient is None or self._aclient_loop is not loop:
+            self.aclient = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=32)
+            )
+            self._bucket_lock = asyncio.Lock()
+            self._aclient_loop = loop
+        return self.aclient
+
+    async def _apost(self, method: str, **kwargs) -> Dict:
+
+        response = await self._get_aclient().post(
+            f"{self.api_url}/{method}",
+            **kwargs
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def broadcast_message_async(
         self,
         chat_ids: List[Union[int, str]],
         text: str,
-        **kwargs
+        parse_mode: str = 'HTML',
+        disable_preview: bool = False,
+        max_batch: int = 10_000
     ) -> List[Dict]:
-  
+
+        if len(chat_ids) > max_batch:
+            raise ValueError(
+                f"Broadcast of {len(chat_ids)} chats exceeds max_batch={max_batch}"
+            )
+
+        # Refresh the client and bucket lock for this loop before the first
+        # token take - the lock is acquired before _apost gets a chance to
+        self._get_aclient()
+
+        # Shared payload fields encoded once; only chat_id varies per send
+        base = {
+            'text': text,
+            'parse_mode': parse_mode,
+            'disable_web_page_preview': disable_preview
+        }
+
+        async def send_one(chat_id):
+            await self._take_token_async()
+            return await self._apost(
+                'sendMessage',
+                content=orjson.dumps({'chat_id': chat_id, **base}),
+                headers=JSON_HEADERS
+            )
+
         results = []
-        for chat_id in chat_ids:
-            try:
-                result = self.send_message(chat_id, text, **kwargs)
-                results.append({
-                    'chat_id': chat_id,
-                    'success': True,
-                    'result': result
-                })
-            except Exception as e:
-                logger.error(f"Error broadcasting to {chat_id}: {e}")
-                results.append({
-                    'chat_id': chat_id,
-                    'success': False,
-                    'error': str(e)
-                })
+        for i in range(0, len(chat_ids), BROADCAST_CHUNK):
+            window_start = time.monotonic()
+            chunk = chat_ids[i:i + BROADCAST_CHUNK]
+            outcomes = await asyncio.gather(
+                *(send_one(chat_id) for chat_id in chunk),
+                return_exceptions=True
+            )
+
+            for chat_id, outcome in zip(chunk, outcomes):
+                if isinstance(outcome, Exception):
+                    logger.error(f"Error broadcasting to {chat_id}: {outcome}")
+                    results.append({
+                        'chat_id': chat_id,
+                        'success': False,
+                        'error': str(outcome)
+                    })
+                else:
+                    results.append({
+                        'chat_id': chat_id,
+                        'success': True,
+                        'result': outcome
+                    })
+
+            # Hold each chunk to roughly a one-second window
+            if i + BROADCAST_CHUNK < len(chat_ids):
+                await asyncio.sleep(max(0, 1.0 - (time.monotonic() - window_start)))
+
         return results
 
+    def broadcast_message(
+        self,
+        chat_ids: List[Union[int, str]],
+        text: str,
+        **kwargs
+    ) -> List[Dict]:
+
+        return asyncio.run(self.broadcast_message_async(chat_ids, text, **kwargs))
+
 # Example usage
 if __name__ == "__main__":
     
@@ -1,7 +1,34 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+import sys
 import time
-import json
+import orjson
+import numpy as np
+
+def _to_float(value, default=0.0):
+    """Lenient float conversion without raising on bad API values"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+@dataclass(slots=True)
+class PairInfo:
+    """Compact record for a qualifying pair; slots keep thousands of these cheap"""
+    name: str
+    symbol: str
+    address: str
+    volume_24h: float
+    price_usd: float
+    liquidity_usd: float
+    holder_count: int
+    market_cap: float
+    dexes: list
+    created_time: str
 
 class JupiterMonitor:
     def __init__(self, volume_threshold_usd=1000):
@@ -9,13 +36,38 @@ class JupiterMonitor:
         self.jupiter_pairs_url = "https://stats.jup.ag/coingecko/pairs"
         self.volume_threshold = volume_threshold_usd
         self.max_age_minutes = 5
+        # One session for every Jupiter call: keep-alive across methods and
+        # a pool sized for the thread-pool workers in scan_new_pairs
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[500, 502, 503, 504]
+            )
+        ))
+        self.session.headers['Accept-Encoding'] = 'gzip, br'
+        # TTL caches - token metadata changes slowly, no point refetching per scan
+        self._info_cache = {}
+        self._info_ttl = 300
+        self._token_list_cache = None
+        self._token_list_ttl = 60
 
     def get_token_list(self):
         """Get list of tokens from Jupiter"""
+        if self._token_list_cache:
+            fetched_at, data = self._token_list_cache
+            if time.monotonic() - fetched_at < self._token_list_ttl:
+                return data
+
         try:
-            response = requests.get(self.jupiter_api_url)
+            response = self.session.get(self.jupiter_api_url, timeout=10)
             if response.status_code == 200:
-                return response.json().get('data', [])
+                data = orjson.loads(response.content).get('data', [])
+                self._token_list_cache = (time.monotonic(), data)
+                return data
             else:
                 print(f"Error: Jupiter API returned status {response.status_code}")
                 return []
@@ -26,9 +78,9 @@ class JupiterMonitor:
     def get_pairs_data(self):
         """Get pairs data from Jupiter"""
         try:
-            response = requests.get(self.jupiter_pairs_url)
+            response = self.session.get(self.jupiter_pairs_url, timeout=10)
             if response.status_code == 200:
-                return response.json()
+                return orjson.loads(response.content)
             else:
                 print(f"Error: Jupiter pairs API returned status {response.status_code}")
                 return []
@@ -38,11 +90,17 @@ class JupiterMonitor:
 
     def get_token_info(self, token_address):
         """Get detailed token information from Jupiter"""
+        entry = self._info_cache.get(token_address)
+        if entry and time.monotonic() - entry[0] < self._info_ttl:
+            return entry[1]
+
         try:
             url = f"https://stats.jup.ag/coingecko/tokens/{token_address}"
-            response = requests.get(url)
+            response = self.session.get(url, timeout=10)
             if response.status_code == 200:
-                return response.json()
+                data = orjson.loads(response.content)
+                self._info_cache[token_address] = (time.monotonic(), data)
+                return data
             return None
         except Exception as e:
             print(f"Error getting token info: {e}")
@@ -55,64 +113,83 @@ class JupiterMonitor:
         try:
             # Get pairs data
             pairs_data = self.get_pairs_data()
-            
-            # Get token list for additional information
-            tokens = {token['address']: token for token in self.get_token_list()}
-            
-            # Filter and process pairs
+
+            # Vectorize the volume filter - one C-level comparison instead of
+            # a Python branch per pair
+            vols = np.fromiter(
+                (_to_float(pair.get('volume24h')) for pair in pairs_data),
+                dtype=np.float64,
+                count=len(pairs_data)
+            )
+            keep = np.flatnonzero(vols >= self.volume_threshold)
+
+            candidates = []
+            for i in keep:
+                pair = pairs_data[i]
+                if (pair.get('baseToken') or {}).get('address'):
+                    candidates.append(pair)
+
+            # Fetch token info concurrently - each call is an independent round-trip
+            with ThreadPoolExecutor(max_workers=16) as ex:
+                infos = list(ex.map(
+                    self.get_token_info,
+                    [p['baseToken']['address'] for p in candidates]
+                ))
+
             new_high_volume_pairs = []
-            
-            for pair in pairs_data:
-                try:
-                    # Get volume
-                    volume_24h = float(pair.get('volume24h', 0))
-                    
-                    # Skip if volume doesn't meet threshold
-                    if volume_24h < self.volume_threshold:
-                        continue
-
-                    # Get token details
-                    token_address = pair.get('baseToken', {}).get('address')
-                    if not token_address:
-                        continue
-
-                    token_info = self.get_token_info(token_address)
-                    if not token_info:
-                        continue
-
-                    # Get detailed information
-                    pair_info = {
-                        'name': token_info.get('name', 'Unknown'),
-                        'symbol': token_info.get('symbol', 'Unknown'),
-                        'address': token_address,
-                        'volume_24h': volume_24h,
-                        'price_usd': float(pair.get('priceUsd', 0)),
-                        'liquidity_usd': float(pair.get('liquidity', {}).get('usd', 0)),
-                        'holder_count': token_info.get('holder_count', 0),
-                        'market_cap': token_info.get('market_cap', 0),
-                        'dexes': pair.get('dexes', []),
-                        'created_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),  # Jupiter doesn't provide creation time
-                    }
-
-                    new_high_volume_pairs.append(pair_info)
-                    
-                    # Print pair information
-                    print("\nHigh Volume Token Found!")
-                    print(f"Name: {pair_info['name']} ({pair_info['symbol']})")
-                    print(f"Address: {pair_info['address']}")
-                    print(f"Volume (24h): ${pair_info['volume_24h']:,.2f}")
-                    print(f"Price: ${pair_info['price_usd']:.8f}")
-                    print(f"Liquidity: ${pair_info['liquidity_usd']:,.2f}")
-                    print(f"Market Cap: ${pair_info['market_cap']:,.2f}")
-                    print(f"Holder Count: {pair_info['holder_count']:,}")
-                    print(f"Available on: {', '.join(pair_info['dexes'])}")
-                    print(f"Birdeye: https://birdeye.so/token/{pair_info['address']}")
-                    print("-" * 50)
-                
-                except Exception as e:
-                    print(f"Error processing pair: {e}")
+            lines = []
+
+            # One timestamp per scan - every record gets the same value anyway
+            scan_ts = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+            for pair, token_info in zip(candidates, infos):
+                # Guard the known failure modes explicitly; exception setup
+                # per pair is far more expensive than a branch
+                if not token_info:
+                    continue
+
+                token_address = (pair.get('baseToken') or {}).get('address')
+                if not token_address:
                     continue
-            
+
+                # Get detailed information
+                pair_info = PairInfo(
+                    name=token_info.get('name', 'Unknown'),
+                    symbol=token_info.get('symbol', 'Unknown'),
+                    address=token_address,
+                    volume_24h=_to_float(pair.get('volume24h')),
+                    price_usd=_to_float(pair.get('priceUsd')),
+                    liquidity_usd=_to_float((pair.get('liquidity') or {}).get('usd')),
+                    holder_count=int(_to_float(token_info.get('holder_count'))),
+                    market_cap=_to_float(token_info.get('market_cap')),
+                    dexes=pair.get('dexes', []),
+                    created_time=scan_ts,  # Jupiter doesn't provide creation time
+                )
+
+                new_high_volume_pairs.append(pair_info)
+
+                # Buffer pair information; one write at the end instead of
+                # a flushing print per line
+                lines.extend([
+                    "",
+                    "High Volume Token Found!",
+                    f"Name: {pair_info.name} ({pair_info.symbol})",
+                    f"Address: {pair_info.address}",
+                    f"Volume (24h): ${pair_info.volume_24h:,.2f}",
+                    f"Price: ${pair_info.price_usd:.8f}",
+                    f"Liquidity: ${pair_info.liquidity_usd:,.2f}",
+                    f"Market Cap: ${pair_info.market_cap:,.2f}",
+                    f"Holder Count: {pair_info.holder_count:,}",
+                    f"Available on: {', '.join(pair_info.dexes)}",
+                    f"Birdeye: https://birdeye.so/token/{pair_info.address}",
+                    "-" * 50
+                ])
+
+            if lines:
+                sys.stdout.write("\n".join(lines))
+                sys.stdout.write("\n")
+                sys.stdout.flush()
+
             return new_high_volume_pairs
 
         except Exception as e: